@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from progressbar import ProgressBar
 
 from helpers import get_files_in_base_path, calc_file_md5
@@ -17,14 +18,22 @@ class PathHasher:
 
         progress_bar = ProgressBar(max_value=page_count)
 
-        for page in range(page_count):
-            page_files = db_wrapper.paginate(files_table, page_size, page)
-            for file in page_files:
-                file_path = file[0]
-                file_md5 = calc_file_md5(file_path)
-                db_wrapper.insert(hash_table, [file_md5, file_path])
-
-            progress_bar.increment()
+        # hashing releases the GIL while reading and digesting, db writes stay
+        # on this thread since the sqlite connection isn't shared
+        with ThreadPoolExecutor() as executor:
+            for page in range(page_count):
+                page_files = db_wrapper.paginate(files_table, page_size, page)
+                file_paths = [file[0] for file in page_files]
+                file_md5s = executor.map(calc_file_md5, file_paths)
+                db_wrapper.insert_many(
+                    hash_table,
+                    [
+                        [file_md5, file_path]
+                        for file_path, file_md5 in zip(file_paths, file_md5s)
+                    ],
+                )
+
+                progress_bar.increment()
 
         progress_bar.finish()
 
@@ -35,12 +44,10 @@ class PathHasher:
 
 def calc_hashes(base_path, exclude_paths, db_wrapper: SqliteWrapper = None):
     print(f"getting files in {base_path}")
-    relevant_files = get_files_in_base_path(
-        base_path,
-        lambda file_path: not any(
-            exclude_path in file_path for exclude_path in exclude_paths
-        ),
+    is_included = lambda path: not any(
+        exclude_path in path for exclude_path in exclude_paths
     )
+    relevant_files = get_files_in_base_path(base_path, is_included, is_included)
 
     db_wrapper.create_table(RELEVANT_FILES_TABLE, ["path TEXT"])
     db_wrapper.insert_many(RELEVANT_FILES_TABLE, [[file] for file in relevant_files])
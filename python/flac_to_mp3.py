@@ -1,5 +1,6 @@
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pydub import AudioSegment
 from progressbar import ProgressBar
 
@@ -35,9 +36,11 @@ def main():
 
     relevant_files = get_relevant_files(args.base_path, lambda x: x.endswith(".flac"))
     progress_bar = ProgressBar(max_value=len(relevant_files))
-    for file in relevant_files:
-        flac_to_mp3(file)
-        progress_bar.increment()
+    # the conversion itself runs in ffmpeg sub processes so threads are enough,
+    # capped since every worker holds a fully decoded flac in memory
+    with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+        for _ in executor.map(flac_to_mp3, relevant_files):
+            progress_bar.increment()
     progress_bar.finish()
 
     print("done!")
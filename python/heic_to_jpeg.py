@@ -7,10 +7,9 @@ from helpers import change_extension
 
 
 def traverse_dir(base_path, cb):
-    for root, dirs, files in os.walk(base_path, topdown=True):
-        for dir in dirs:
-            traverse_dir(os.path.join(root, dir), cb)
-
+    # os.walk already descends into sub directories, recursing here as well
+    # would visit (and convert) nested files over and over
+    for root, _, files in os.walk(base_path):
         for file in files:
             cb(os.path.join(root, file))
 
@@ -6,12 +6,16 @@ def change_extension(filename, new_extension):
     return os.path.splitext(filename)[0] + new_extension
 
 
-def get_files_in_base_path(base_path, filter_cb=None):
+def get_files_in_base_path(base_path, filter_cb=None, dir_filter_cb=None):
     if filter_cb is None:
         filter_cb = lambda _: True
 
     relevant_files = []
-    for root, _, files in os.walk(base_path):
+    for root, dirs, files in os.walk(base_path):
+        if dir_filter_cb is not None:
+            # prune in place so os.walk doesn't descend into filtered dirs
+            dirs[:] = [dir for dir in dirs if dir_filter_cb(os.path.join(root, dir))]
+
         for file in files:
             file_path = os.path.join(root, file)
             if filter_cb(file_path):
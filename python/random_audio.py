@@ -133,7 +133,7 @@ def main():
         key, scale, meter, bpm = get_random_song_details()
         prompt = generate_prompt(key, scale, meter, bpm)
         print(prompt)
-        exit(0)
+        return
     if args.key:
         random_key = random.choice(KEYS)
         print(f"key: {random_key}")
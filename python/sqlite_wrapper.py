@@ -26,6 +26,9 @@ class SqliteWrapper:
         self._db.commit()
 
     def insert_many(self, table_name, values):
+        if not values:
+            return
+
         self._cursor.executemany(
             f"""
             INSERT INTO {table_name} VALUES ({', '.join(['?' for _ in values[0]])})